@@ -12,44 +12,55 @@ class Neuron {
         this.resetVoltage = params.resetVoltage ?? -70;
         this.stimulus = params.stimulus ?? 5;
         this.name = params.name || "Unknown";
-        
-        // Simulation state
+
+        // Simulation state — every field an instance will ever carry is
+        // declared here, in this order, so all Neurons share one object
+        // shape and the hot-path attribute reads stay monomorphic
         this.spikes = 0;
-        this.voltageHistory = [];
-        this.spikeTimeSteps = [];
+        this.voltageHistory = new Float32Array(0);
+        this.spikeTimeSteps = new Int32Array(0);
+        this._nspk = 0;
+        this._debugLines = [];
         this.simulationLog = [];
-        
+
         this.reset();
     }
     
-    reset() {
+    // Preallocates the trace buffers for a run of `steps` timesteps:
+    // 4-byte float samples and index-assignment instead of growing plain
+    // arrays one push at a time. Callers driving step() directly must
+    // reset(steps) first so the buffers have room.
+    reset(steps = 0) {
         this.spikes = 0;
-        this.voltageHistory = [];
-        this.spikeTimeSteps = [];
+        this.voltageHistory = new Float32Array(steps);
+        this.spikeTimeSteps = new Int32Array(steps);
+        this._nspk = 0; // write cursor into spikeTimeSteps
+        this._debugLines = []; // per-step debug output, flushed in one console.log
         this.simulationLog = [];
         this.voltage = this.voltage < 0 ? this.voltage : -70; // Ensure negative initial voltage
     }
-    
+
     step(timeStep) {
         // Add stimulus
         this.voltage += this.stimulus;
-        
+
         // Record voltage before potential spike
-        this.voltageHistory.push(this.voltage);
-        
-        // Debug logging for first few steps
+        this.voltageHistory[timeStep] = this.voltage;
+
+        // Debug logging for first few steps — buffered, one console.log
+        // per run instead of one per step
         if (timeStep < 5 || this.voltage >= this.threshold) {
-            console.log(`[DEBUG] Step ${timeStep + 1}: voltage=${this.voltage.toFixed(1)}mV, threshold=${this.threshold}mV`);
+            this._debugLines.push(`[DEBUG] Step ${timeStep + 1}: voltage=${this.voltage.toFixed(1)}mV, threshold=${this.threshold}mV`);
         }
-        
+
         // Check for action potential
         if (this.voltage >= this.threshold) {
             // Spike occurred
             this.voltage = this.spikeVoltage; // Brief peak
-            this.voltageHistory[this.voltageHistory.length - 1] = this.spikeVoltage; // Update history
+            this.voltageHistory[timeStep] = this.spikeVoltage; // Update history
             this.voltage = this.resetVoltage; // Reset
             this.spikes++;
-            this.spikeTimeSteps.push(timeStep);
+            this.spikeTimeSteps[this._nspk++] = timeStep;
             
             this.simulationLog.push({
                 timeStep: timeStep + 1,
@@ -71,9 +82,46 @@ class Neuron {
         }
     }
     
+    /**
+     * Spike schedule for the constant-stimulus, instant-reset rule.
+     * With a fixed stimulus the dynamics are a closed form: the first spike
+     * lands on step ceil((threshold - voltage) / stimulus) and every
+     * ceil((threshold - resetVoltage) / stimulus) steps after that.
+     * Returns { first, period } as 1-based step counts (minimum 1 each).
+     */
+    spikeSchedule() {
+        const first = Math.max(1, Math.ceil((this.threshold - this.voltage) / this.stimulus));
+        const period = Math.max(1, Math.ceil((this.threshold - this.resetVoltage) / this.stimulus));
+        return { first, period };
+    }
+
+    /**
+     * Closed-form spike count for a run of `steps` timesteps — O(1),
+     * no trace or log materialized. Matches what simulate() would
+     * record for the same parameters.
+     */
+    countSpikes(steps = 20) {
+        if (steps <= 0) {
+            return 0;
+        }
+        if (this.stimulus <= 0) {
+            // Voltage never climbs: at most the first step can fire, and
+            // only a reset landing at/above threshold keeps it firing
+            if (this.voltage + this.stimulus < this.threshold) {
+                return 0;
+            }
+            return this.resetVoltage + this.stimulus >= this.threshold ? steps : 1;
+        }
+        const { first, period } = this.spikeSchedule();
+        if (first > steps) {
+            return 0;
+        }
+        return 1 + Math.floor((steps - first) / period);
+    }
+
     simulate(steps = 20) {
-        this.reset();
-        
+        this.reset(steps);
+
         // Debug logging
         console.log(`[DEBUG] Simulating ${this.name}:`, {
             voltage: this.voltage,
@@ -81,7 +129,7 @@ class Neuron {
             stimulus: this.stimulus,
             resetVoltage: this.resetVoltage
         });
-        
+
         const results = {
             name: this.name,
             parameters: {
@@ -97,23 +145,84 @@ class Neuron {
             spikeTimeSteps: [],
             simulationLog: []
         };
-        
-        for (let t = 0; t < steps; t++) {
-            this.step(t);
+
+        if (this.stimulus > 0) {
+            // Closed-form path: compute the spike schedule analytically and
+            // fill the trace arrays directly instead of dispatching step()
+            // per timestep. step() is kept for API compatibility.
+            const { first, period } = this.spikeSchedule();
+            const firstIndex = first - 1; // 0-based step of the first spike
+            const v0 = this.voltage;
+
+            for (let t = 0; t < steps; t++) {
+                let v;
+                let spiked = false;
+                if (t < firstIndex) {
+                    v = v0 + this.stimulus * (t + 1);
+                } else {
+                    const sinceSpike = (t - firstIndex) % period;
+                    spiked = sinceSpike === 0;
+                    v = spiked ? this.spikeVoltage : this.resetVoltage + this.stimulus * sinceSpike;
+                }
+                this.voltageHistory[t] = v;
+                if (spiked) {
+                    this.spikeTimeSteps[this._nspk++] = t;
+                }
+                this.simulationLog.push(spiked ? {
+                    timeStep: t + 1,
+                    type: 'spike',
+                    voltage: this.spikeVoltage,
+                    message: `SPIKE! ⚡ (Reset to ${this.resetVoltage}mV)`
+                } : {
+                    timeStep: t + 1,
+                    type: 'normal',
+                    voltage: v,
+                    message: `Voltage = ${v.toFixed(1)}mV`
+                });
+            }
+            // Leave this.voltage where the step loop would have (spikes reset it)
+            if (steps > 0) {
+                const last = steps - 1;
+                this.voltage = last < firstIndex
+                    ? v0 + this.stimulus * steps
+                    : this.resetVoltage + this.stimulus * ((last - firstIndex) % period);
+            }
+        } else {
+            // Non-positive stimulus has no regular schedule; step through
+            for (let t = 0; t < steps; t++) {
+                this.step(t);
+            }
         }
-        
-        // Calculate final metrics
+
+        // Flush buffered per-step debug output in a single write
+        if (this._debugLines.length > 0) {
+            console.log(this._debugLines.join('\n'));
+            this._debugLines = [];
+        }
+
+        // Trim the spike-time buffer to the spikes actually recorded
+        this.spikeTimeSteps = this.spikeTimeSteps.subarray(0, this._nspk);
+        this.spikes = this._nspk;
+
+        // Calculate final metrics — the typed buffers go into the results
+        // as-is; display code converts at the boundary where needed
         results.spikes = this.spikes;
         results.firingRate = this.spikes / steps;
-        results.voltageHistory = [...this.voltageHistory];
-        results.spikeTimeSteps = [...this.spikeTimeSteps];
-        results.simulationLog = [...this.simulationLog];
-        
+        results.voltageHistory = this.voltageHistory;
+        results.spikeTimeSteps = this.spikeTimeSteps;
+        results.simulationLog = this.simulationLog;
+
         return results;
     }
     
-    diagnose(steps = 20) {
-        const results = this.simulate(steps);
+    // Pass the results of an earlier simulate() run to diagnose it
+    // directly; otherwise the firing rate is derived from the closed-form
+    // spike count — no trace needs to be simulated for a diagnosis.
+    diagnose(steps = 20, results = null) {
+        if (!results) {
+            const spikes = this.countSpikes(steps);
+            results = { spikes: spikes, firingRate: steps > 0 ? spikes / steps : 0 };
+        }
         const firingRate = results.firingRate;
         
         const diagnosis = {
@@ -266,6 +375,234 @@ const CASE_CONFIGS = {
     }
 };
 
+/**
+ * Fused per-step kernel for the batched simulation.
+ * Kept as a standalone function taking only typed arrays and plain
+ * numbers so the engine JIT sees one monomorphic, allocation-free hot
+ * loop: add, compare, select, reset and count happen in a single pass
+ * over the row instead of separate vector operations with temporaries.
+ */
+function _stepBatch(V, thr, stim, reset, spikeV, hist, fired, spikes, row, n) {
+    for (let i = 0; i < n; i++) {
+        const v = V[i] + stim[i];
+        // Branchless select: f is 0 or 1, so each lane blends between the
+        // climbing voltage and the spike/reset values with no
+        // data-dependent control flow in the loop body. The a*f + b*g
+        // form is exact for f in {0,1}, unlike b + (a-b)*f.
+        const f = +(v >= thr[i]);
+        const g = 1 - f;
+        hist[row + i] = spikeV[i] * f + v * g;
+        V[i] = reset[i] * f + v * g;
+        fired[row + i] = f;
+        spikes[i] += f;
+    }
+}
+
+/**
+ * Simulate many neurons at once in Struct-of-Arrays form.
+ * Instead of looping cases and calling neuron.simulate() one at a time,
+ * the per-neuron parameters are packed into typed arrays and a single
+ * time loop advances every neuron per step. Results are unpacked back
+ * onto each Neuron and returned in the same shape simulate() produces.
+ */
+function simulateBatch(neurons, steps = 20) {
+    // float32 throughout: millivolt values need ~0.1 mV precision, and
+    // halving the element width halves the bytes the step kernel moves.
+    // Voltages in the unpacked results are float32-rounded accordingly.
+    const n = neurons.length;
+    const V = new Float32Array(n);
+    const thr = new Float32Array(n);
+    const stim = new Float32Array(n);
+    const reset = new Float32Array(n);
+    const spikeV = new Float32Array(n);
+    const spikes = new Int32Array(n);
+    const hist = new Float32Array(steps * n);   // row-major: hist[t*n + i]
+    const fired = new Uint8Array(steps * n);
+
+    neurons.forEach((neuron, i) => {
+        neuron.reset();
+        V[i] = neuron.voltage;
+        thr[i] = neuron.threshold;
+        stim[i] = neuron.stimulus;
+        reset[i] = neuron.resetVoltage;
+        spikeV[i] = neuron.spikeVoltage;
+    });
+
+    for (let t = 0; t < steps; t++) {
+        _stepBatch(V, thr, stim, reset, spikeV, hist, fired, spikes, t * n, n);
+    }
+
+    // Unpack batch state back into per-neuron results
+    return neurons.map((neuron, i) => {
+        const results = {
+            name: neuron.name,
+            parameters: {
+                threshold: neuron.threshold,
+                resetVoltage: neuron.resetVoltage,
+                stimulus: neuron.stimulus,
+                initialVoltage: neuron.voltage
+            },
+            steps: steps,
+            spikes: spikes[i],
+            firingRate: steps > 0 ? spikes[i] / steps : 0,
+            voltageHistory: [],
+            spikeTimeSteps: [],
+            simulationLog: []
+        };
+
+        for (let t = 0; t < steps; t++) {
+            const v = hist[t * n + i];
+            results.voltageHistory.push(v);
+            if (fired[t * n + i]) {
+                results.spikeTimeSteps.push(t);
+                results.simulationLog.push({
+                    timeStep: t + 1,
+                    type: 'spike',
+                    voltage: v,
+                    message: `SPIKE! ⚡ (Reset to ${neuron.resetVoltage}mV)`
+                });
+            } else {
+                results.simulationLog.push({
+                    timeStep: t + 1,
+                    type: 'normal',
+                    voltage: v,
+                    message: `Voltage = ${v.toFixed(1)}mV`
+                });
+            }
+        }
+
+        neuron.voltage = V[i];
+        neuron.spikes = spikes[i];
+        neuron.voltageHistory = results.voltageHistory;
+        neuron.spikeTimeSteps = results.spikeTimeSteps;
+        neuron.simulationLog = results.simulationLog;
+
+        return results;
+    });
+}
+
+// Run every predefined case through one batched simulation
+function simulateAllCases(steps = 20) {
+    const neurons = getAllCaseNames().map(createNeuronFromCase);
+    return simulateBatch(neurons, steps);
+}
+
+/**
+ * Run all predefined cases on a Web Worker so the UI thread stays
+ * responsive during long runs. Each case is independent, so the whole
+ * batch ships to one worker and the per-case results come back as a
+ * structured-clone message. Falls back to the synchronous batch where
+ * workers are unavailable. Returns a Promise of simulateAllCases()'s
+ * result array.
+ */
+function simulateAllCasesAsync(steps = 20, scriptBase = './public/js') {
+    if (typeof Worker === 'undefined') {
+        return Promise.resolve(simulateAllCases(steps));
+    }
+    return new Promise((resolve, reject) => {
+        const worker = new Worker(`${scriptBase}/simulation-worker.js`);
+        worker.onmessage = (event) => {
+            worker.terminate();
+            resolve(event.data);
+        };
+        worker.onerror = (event) => {
+            worker.terminate();
+            reject(new Error(`Simulation worker failed: ${event.message}`));
+        };
+        worker.postMessage({ steps });
+    });
+}
+
+/**
+ * Build a plain-text case report from a set of simulation results
+ * (e.g. the array simulateAllCases returns). Lines accumulate in one
+ * buffer and are joined exactly once, so the whole report is a single
+ * string ready for download or display — no incremental writes.
+ */
+function generateReport(neuronResults) {
+    const lines = [];
+    lines.push('NEURAL DETECTIVE - CASE REPORT');
+    lines.push('='.repeat(40));
+    for (const results of neuronResults) {
+        const neuron = new Neuron({
+            ...results.parameters,
+            voltage: results.parameters.initialVoltage,
+            name: results.name
+        });
+        const diagnosis = neuron.diagnose(results.steps, results);
+        const spikeTimes = results.spikeTimeSteps.length > 0
+            ? Array.from(results.spikeTimeSteps, t => t + 1).join(', ')
+            : 'None';
+        lines.push('');
+        lines.push(`Case: ${results.name}`);
+        lines.push(`  Spikes: ${results.spikes} in ${results.steps} steps (firing rate ${(results.firingRate * 100).toFixed(1)}%)`);
+        lines.push(`  Spike times: ${spikeTimes}`);
+        lines.push(`  Problem: ${diagnosis.problem} (${diagnosis.severity})`);
+        lines.push(`  Explanation: ${diagnosis.explanation}`);
+        lines.push(`  Recommendation: ${diagnosis.recommendation}`);
+    }
+    return lines.join('\n') + '\n';
+}
+
+// Case files shipped in data/
+const CASE_FILES = [
+    'case_a.json',
+    'case_b.json',
+    'case_c.json',
+    'case_d.json',
+    'case_normal.json'
+];
+
+// Case files use snake_case keys; map them onto the camelCase names
+// Neuron and the UI expect
+function _normalizeCaseData(caseData) {
+    const p = caseData.parameters || {};
+    return {
+        name: caseData.name,
+        description: caseData.description,
+        parameters: {
+            voltage: p.voltage,
+            threshold: p.threshold,
+            spikeVoltage: p.spike_voltage ?? p.spikeVoltage,
+            resetVoltage: p.reset_voltage ?? p.resetVoltage,
+            stimulus: p.stimulus
+        },
+        expectedProblem: caseData.expected_problem ?? caseData.expectedProblem,
+        biologicalContext: caseData.biological_context ?? caseData.biologicalContext,
+        learningObjective: caseData.learning_objective ?? caseData.learningObjective
+    };
+}
+
+/**
+ * Load case configurations from the JSON files in data/.
+ * Parsing goes through response.json() — the browser's native JSON
+ * parser — rather than text() + a JS-level parse. Returns an object
+ * keyed by case name, same shape as CASE_CONFIGS.
+ */
+async function loadCaseFiles(dataDir = './data', files = CASE_FILES) {
+    const cases = {};
+    // Browsers cannot list a directory, so `files` plays the role of the
+    // listing — callers may pass any set of entries and plain prefix/
+    // suffix checks select the case files, no pattern matching involved
+    const caseFiles = files.filter(f => f.startsWith('case_') && f.endsWith('.json'));
+
+    // Fetch and parse all files concurrently — requests overlap instead
+    // of each one waiting for the previous response
+    const loaded = await Promise.all(caseFiles.map(async (file) => {
+        const response = await fetch(`${dataDir}/${file}`);
+        if (!response.ok) {
+            throw new Error(`Failed to load case file: ${file} (${response.status})`);
+        }
+        return _normalizeCaseData(await response.json());
+    }));
+
+    // Build the cases dict serially so ordering stays deterministic
+    for (const caseData of loaded) {
+        cases[caseData.name] = caseData;
+    }
+    return cases;
+}
+
 // Utility functions
 function createNeuronFromCase(caseName) {
     const caseConfig = CASE_CONFIGS[caseName];
@@ -291,6 +628,11 @@ if (typeof window !== 'undefined') {
         CASE_CONFIGS,
         createNeuronFromCase,
         getCaseConfig,
-        getAllCaseNames
+        getAllCaseNames,
+        simulateBatch,
+        simulateAllCases,
+        simulateAllCasesAsync,
+        loadCaseFiles,
+        generateReport
     };
 }
\ No newline at end of file
@@ -0,0 +1,13 @@
+/**
+ * Neural Detective - Simulation Worker
+ * Runs the batched all-cases simulation off the main thread so long
+ * runs never block the UI. Messages in: { steps }. Messages out: the
+ * array of per-case results simulateAllCases() produces.
+ */
+
+importScripts('neuron-simulator.js');
+
+self.onmessage = (event) => {
+    const { steps } = event.data;
+    self.postMessage(simulateAllCases(steps));
+};
@@ -4,12 +4,27 @@
  * Complete investigate → diagnose → treat workflow for neurological case studies
  */
 
+// Chart styling shared by the config callbacks and per-update data
+// mapping — defined once at module level instead of inline per render
+const SPIKE_DISPLAY_THRESHOLD_MV = 20;
+
+// Traces longer than this are stride-sampled for display; the full
+// Float32Array trace in the results stays untouched for analysis
+const MAX_CHART_POINTS = 2000;
+const SPIKE_COLOR = '#e74c3c';
+const SPIKE_BORDER_COLOR = '#c0392b';
+const TRACE_COLOR = '#3498db';
+const TRACE_BORDER_COLOR = '#2980b9';
+
 class NeuralDetectiveApp {
     constructor() {
         this.currentCase = null;
         this.currentResults = null;
         this.voltageChart = null;
-        
+        this.chartRendered = false; // first update animates, later ones redraw in place
+        this._timeAxis = null; // cached chart labels, shared across runs of the same length
+        this._timeAxisStride = 1;
+
         this.initializeElements();
         this.attachEventListeners();
         this.initializeChart();
@@ -90,14 +105,24 @@ class NeuralDetectiveApp {
                 datasets: [{
                     label: 'Membrane Voltage (mV)',
                     data: [],
-                    borderColor: '#3498db',
+                    borderColor: TRACE_COLOR,
                     backgroundColor: 'rgba(52, 152, 219, 0.1)',
                     borderWidth: 3,
-                    pointBackgroundColor: '#3498db',
-                    pointBorderColor: '#2980b9',
-                    pointRadius: 5,
+                    pointBackgroundColor: TRACE_COLOR,
+                    pointBorderColor: TRACE_BORDER_COLOR,
+                    pointRadius: 0, // bare line; spikes drawn by the overlay dataset
                     pointHoverRadius: 7,
                     tension: 0.2
+                }, {
+                    // Spike markers only — one sparse overlay dataset instead
+                    // of a marker artist on every trace sample
+                    label: 'Action Potentials ⚡',
+                    data: [],
+                    showLine: false,
+                    pointBackgroundColor: SPIKE_COLOR,
+                    pointBorderColor: SPIKE_BORDER_COLOR,
+                    pointRadius: 6,
+                    pointHoverRadius: 8
                 }]
             },
             options: {
@@ -156,7 +181,7 @@ class NeuralDetectiveApp {
                             },
                             label: function(context) {
                                 const value = context.parsed.y;
-                                const isSpike = value > 20; // Detect spikes
+                                const isSpike = value > SPIKE_DISPLAY_THRESHOLD_MV;
                                 return `${context.dataset.label}: ${value.toFixed(1)}mV${isSpike ? ' ⚡' : ''}`;
                             }
                         }
@@ -217,7 +242,7 @@ class NeuralDetectiveApp {
                     point: {
                         backgroundColor: function(context) {
                             const value = context.parsed.y;
-                            return value > 20 ? '#e74c3c' : '#3498db'; // Red for spikes
+                            return value > SPIKE_DISPLAY_THRESHOLD_MV ? SPIKE_COLOR : TRACE_COLOR;
                         }
                     }
                 },
@@ -375,11 +400,37 @@ class NeuralDetectiveApp {
     }
     
     updateChart(results) {
-        const labels = results.voltageHistory.map((_, index) => index + 1);
-        
-        // Update chart data
-        this.voltageChart.data.labels = labels;
-        this.voltageChart.data.datasets[0].data = results.voltageHistory;
+        // Decimate long traces to a bounded number of chart points —
+        // the chart holds every stride-th sample while the full trace
+        // remains in the results for analysis
+        let trace = results.voltageHistory;
+        let stride = 1;
+        if (trace.length > MAX_CHART_POINTS) {
+            stride = Math.ceil(trace.length / MAX_CHART_POINTS);
+            const sampled = new Float32Array(Math.ceil(trace.length / stride));
+            for (let i = 0; i < sampled.length; i++) {
+                sampled[i] = trace[i * stride];
+            }
+            trace = sampled;
+        }
+
+        // Every trace of a given length shares the same time axis, so the
+        // label array is built once and reused until the run length (or
+        // decimation stride) changes
+        if (!this._timeAxis || this._timeAxis.length !== trace.length || this._timeAxisStride !== stride) {
+            this._timeAxis = Array.from(trace, (_, index) => index * stride + 1);
+            this._timeAxisStride = stride;
+        }
+
+        // Update chart data — full trace on the line dataset, spike
+        // samples only on the marker overlay. voltageHistory may be a
+        // Float32Array; Array.from converts at the chart boundary (a
+        // typed-array map would coerce the overlay's nulls to 0)
+        this.voltageChart.data.labels = this._timeAxis;
+        this.voltageChart.data.datasets[0].data = trace;
+        this.voltageChart.data.datasets[1].data = Array.from(trace, voltage =>
+            voltage > SPIKE_DISPLAY_THRESHOLD_MV ? voltage : null
+        );
         
         // Update threshold line if parameters changed
         const threshold = results.parameters.threshold;
@@ -389,14 +440,12 @@ class NeuralDetectiveApp {
             this.voltageChart.options.plugins.annotation.annotations.thresholdLine.label.content = `Threshold: ${threshold}mV`;
         }
         
-        // Color spike points red
-        this.voltageChart.data.datasets[0].pointBackgroundColor = results.voltageHistory.map(voltage => 
-            voltage > 20 ? '#e74c3c' : '#3498db'
-        );
-        
-        this.voltageChart.update();
+        // Reuse the cached chart: animate the first render, then update
+        // in place without replaying the 1s easing on every rerun
+        this.voltageChart.update(this.chartRendered ? 'none' : undefined);
+        this.chartRendered = true;
     }
-    
+
     displaySimulationLog(logEntries) {
         const logHTML = logEntries.map(entry => {
             const entryClass = entry.type === 'spike' ? 'log-entry spike' : 'log-entry normal';
@@ -414,8 +463,10 @@ class NeuralDetectiveApp {
             return;
         }
         
+        // Reuse the results from the run the user just saw instead of
+        // re-simulating the case
         const neuron = NeuralDetective.createNeuronFromCase(this.currentCase);
-        const diagnosis = neuron.diagnose(parseInt(this.timeStepsSlider.value));
+        const diagnosis = neuron.diagnose(parseInt(this.timeStepsSlider.value), this.currentResults);
         
         const severityClass = diagnosis.severity.toLowerCase();
         
@@ -468,7 +519,9 @@ class NeuralDetectiveApp {
         // Reset chart
         this.voltageChart.data.labels = [];
         this.voltageChart.data.datasets[0].data = [];
+        this.voltageChart.data.datasets[1].data = [];
         this.voltageChart.update();
+        this.chartRendered = false;
         
         // Scroll to top
         window.scrollTo({ top: 0, behavior: 'smooth' });
@@ -707,5 +760,22 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
     
+    // Warm the simulation kernels while the page is idle so the first
+    // user-triggered run doesn't pay engine compilation and inline-cache
+    // warm-up on top of the simulation itself
+    const warmUpSimulator = () => {
+        try {
+            NeuralDetective.simulateAllCases(20);
+            NeuralDetective.createNeuronFromCase('Normal').simulate(20);
+        } catch (error) {
+            console.warn('Simulator warm-up skipped:', error);
+        }
+    };
+    if ('requestIdleCallback' in window) {
+        requestIdleCallback(warmUpSimulator);
+    } else {
+        setTimeout(warmUpSimulator, 0);
+    }
+
     console.log('🧠 Neural Detective Application initialized!');
 });